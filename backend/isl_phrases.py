@@ -0,0 +1,41 @@
+# Audio to ISL shared vocabulary
+# Phrases and letters with sign visuals, used by the API server and the standalone app
+
+# ISL phrases that have corresponding GIF files
+ISL_PHRASES_TUPLE = (
+    'any questions', 'are you angry', 'are you busy', 'are you hungry', 'are you sick', 'be careful',
+    'can we meet tomorrow', 'did you book tickets', 'did you finish homework', 'do you go to office', 
+    'do you have money', 'do you want something to drink', 'do you want tea or coffee', 'do you watch TV', 
+    'dont worry', 'flower is beautiful', 'good afternoon', 'good evening', 'good morning', 'good night', 
+    'good question', 'had your lunch', 'happy journey', 'hello what is your name', 
+    'how many people are there in your family', 'i am a clerk', 'i am bore doing nothing', 
+    'i am fine', 'i am sorry', 'i am thinking', 'i am tired', 'i dont understand anything', 
+    'i go to a theatre', 'i love to shop', 'i had to say something but i forgot', 'i have headache', 
+    'i like pink colour', 'i live in nagpur', 'lets go for lunch', 'my mother is a homemaker',
+    'my name is john', 'nice to meet you', 'no smoking please', 'open the door', 'please call me later',
+    'please clean the room', 'please give me your pen', 'please use dustbin dont throw garbage', 
+    'please wait for sometime', 'shall I help you', 'shall we go together tommorow', 
+    'sign language interpreter', 'sit down', 'stand up', 'take care', 'there was traffic jam', 
+    'wait I am thinking', 'what are you doing', 'what is the problem', 'what is todays date', 
+    'what is your father do', 'what is your job', 'what is your mobile number', 'what is your name', 
+    'whats up', 'when is your interview', 'when we will go', 'where do you stay',
+    'where is the bathroom', 'where is the police station', 'you are wrong',
+    # Single words with GIFs
+    'address', 'agra', 'ahemdabad', 'all', 'april', 'assam', 'august', 'australia', 
+    'badoda', 'banana', 'banaras', 'banglore', 'bihar', 'bridge', 'cat', 'chandigarh', 
+    'chennai', 'christmas', 'church', 'clinic', 'coconut', 'crocodile', 'dasara', 'deaf', 
+    'december', 'deer', 'delhi', 'dollar', 'duck', 'febuary', 'friday', 'fruits', 'glass', 
+    'grapes', 'gujrat', 'hello', 'hindu', 'hyderabad', 'india', 'january', 'jesus', 'job', 
+    'july', 'june', 'karnataka', 'kerala', 'krishna', 'litre', 'mango', 'may', 'mile', 'monday', 
+    'mumbai', 'museum', 'muslim', 'nagpur', 'october', 'orange', 'pakistan', 'pass', 
+    'police station', 'post office', 'pune', 'punjab', 'rajasthan', 'ram', 'restaurant', 
+    'saturday', 'september', 'shop', 'sleep', 'southafrica', 'story', 'sunday', 
+    'tamil nadu', 'temperature', 'temple', 'thank', 'thursday', 'toilet', 'tomato', 'town', 
+    'tuesday', 'usa', 'village', 'voice', 'wednesday', 'weight', 'welcome', 'hi', 'yourself'
+)
+
+# Hashed set for O(1) membership checks
+ISL_PHRASES = frozenset(ISL_PHRASES_TUPLE)
+
+# Available letter images (a-z)
+AVAILABLE_LETTERS = list('abcdefghijklmnopqrstuvwxyz')
@@ -1,14 +1,24 @@
 # Audio to ISL Backend API Server
 # FastAPI-based REST API for converting text to Indian Sign Language visuals
 
+import functools
+import hashlib
 import os
 import string
-from typing import Literal, Union
-from fastapi import FastAPI, HTTPException
+import sys
+from pathlib import Path
+from contextlib import asynccontextmanager
+from typing import Annotated, Literal, Union
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from dotenv import load_dotenv
+import orjson
+
+from isl_phrases import AVAILABLE_LETTERS, ISL_PHRASES_TUPLE
 
 # Load environment variables
 load_dotenv()
@@ -16,13 +26,85 @@ load_dotenv()
 # Configuration
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8000))
+THREAD_LIMIT = int(os.getenv("THREAD_LIMIT", 100))
+# Each worker is a separate process with its own GIL; default to one per CPU core
+WORKERS = int(os.getenv("WORKERS", os.cpu_count() or 1))
+# Set to 0 when a reverse proxy (see docker-compose.yml) serves /static directly
+SERVE_STATIC = os.getenv("SERVE_STATIC", "1") == "1"
+# Input limits; the body size caps are derived from them below
+MAX_TEXT_LENGTH = 500
+MAX_BATCH_TEXTS = 128
+# Worst-case JSON size of one valid text: every character escaped as a
+# \uXXXX\uXXXX surrogate pair (12 bytes), plus quotes and separators
+_MAX_ENCODED_TEXT = MAX_TEXT_LENGTH * 12 + 16
+# Allowance for the object envelope and any whitespace around it
+_BODY_ENVELOPE = 1024
+MAX_BODY_SIZE = _MAX_ENCODED_TEXT + _BODY_ENVELOPE
+MAX_BATCH_BODY_SIZE = _MAX_ENCODED_TEXT * MAX_BATCH_TEXTS + _BODY_ENVELOPE
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints run on the anyio threadpool; raise its default cap of 40
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_LIMIT
+    yield
 
 app = FastAPI(
     title="Audio to ISL API",
     description="REST API for converting text/speech to Indian Sign Language visuals",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
+)
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies larger than the route's limit before they are parsed"""
+
+    def __init__(self, app, max_body_size: int, batch_path: str, max_batch_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.batch_path = batch_path
+        self.max_batch_size = max_batch_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.max_batch_size if scope["path"] == self.batch_path else self.max_body_size
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if not value.isdigit():
+                    response = JSONResponse({"detail": "Invalid Content-Length header"}, status_code=400)
+                    await response(scope, receive, send)
+                    return
+                if int(value) > limit:
+                    response = JSONResponse({"detail": "Request body too large"}, status_code=413)
+                    await response(scope, receive, send)
+                    return
+                break
+
+        # Chunked bodies carry no Content-Length, so count bytes as they are read.
+        # FastAPI turns the HTTPException into the 413 response before any parsing.
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+# Added before CORS so that CORS wraps it and browsers can read the 400/413
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=MAX_BODY_SIZE,
+    batch_path="/api/convert_batch",
+    max_batch_size=MAX_BATCH_BODY_SIZE,
 )
 
 # CORS Configuration - Allow all origins for API accessibility
@@ -35,135 +117,232 @@ app.add_middleware(
 )
 
 # Static file directories
-GIFS_DIR = os.path.join(os.path.dirname(__file__), "ISL_Gifs")
-LETTERS_DIR = os.path.join(os.path.dirname(__file__), "letters")
+_ROOT = Path(__file__).resolve().parent
+GIFS_DIR = _ROOT / "ISL_Gifs"
+LETTERS_DIR = _ROOT / "letters"
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers and CDNs cache assets for 30 days"""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=2592000, immutable"
+        return response
+
+# Phrases whose GIF file is present, checked once at import; the rest are spelled out
+GIF_PHRASES = tuple(phrase for phrase in ISL_PHRASES_TUPLE if (GIFS_DIR / f"{phrase}.gif").is_file())
 
 # Mount static files for serving GIFs and letter images
-if os.path.exists(GIFS_DIR):
-    app.mount("/static/gifs", StaticFiles(directory=GIFS_DIR), name="gifs")
-if os.path.exists(LETTERS_DIR):
-    app.mount("/static/letters", StaticFiles(directory=LETTERS_DIR), name="letters")
-
-# ISL phrases that have corresponding GIF files
-ISL_PHRASES = [
-    'any questions', 'are you angry', 'are you busy', 'are you hungry', 'are you sick', 'be careful',
-    'can we meet tomorrow', 'did you book tickets', 'did you finish homework', 'do you go to office', 
-    'do you have money', 'do you want something to drink', 'do you want tea or coffee', 'do you watch TV', 
-    'dont worry', 'flower is beautiful', 'good afternoon', 'good evening', 'good morning', 'good night', 
-    'good question', 'had your lunch', 'happy journey', 'hello what is your name', 
-    'how many people are there in your family', 'i am a clerk', 'i am bore doing nothing', 
-    'i am fine', 'i am sorry', 'i am thinking', 'i am tired', 'i dont understand anything', 
-    'i go to a theatre', 'i love to shop', 'i had to say something but i forgot', 'i have headache', 
-    'i like pink colour', 'i live in nagpur', 'lets go for lunch', 'my mother is a homemaker',
-    'my name is john', 'nice to meet you', 'no smoking please', 'open the door', 'please call me later',
-    'please clean the room', 'please give me your pen', 'please use dustbin dont throw garbage', 
-    'please wait for sometime', 'shall I help you', 'shall we go together tommorow', 
-    'sign language interpreter', 'sit down', 'stand up', 'take care', 'there was traffic jam', 
-    'wait I am thinking', 'what are you doing', 'what is the problem', 'what is todays date', 
-    'what is your father do', 'what is your job', 'what is your mobile number', 'what is your name', 
-    'whats up', 'when is your interview', 'when we will go', 'where do you stay',
-    'where is the bathroom', 'where is the police station', 'you are wrong',
-    # Single words with GIFs
-    'address', 'agra', 'ahemdabad', 'all', 'april', 'assam', 'august', 'australia', 
-    'badoda', 'banana', 'banaras', 'banglore', 'bihar', 'bridge', 'cat', 'chandigarh', 
-    'chennai', 'christmas', 'church', 'clinic', 'coconut', 'crocodile', 'dasara', 'deaf', 
-    'december', 'deer', 'delhi', 'dollar', 'duck', 'febuary', 'friday', 'fruits', 'glass', 
-    'grapes', 'gujrat', 'hello', 'hindu', 'hyderabad', 'india', 'january', 'jesus', 'job', 
-    'july', 'june', 'karnataka', 'kerala', 'krishna', 'litre', 'mango', 'may', 'mile', 'monday', 
-    'mumbai', 'museum', 'muslim', 'nagpur', 'october', 'orange', 'pakistan', 'pass', 
-    'police station', 'post office', 'pune', 'punjab', 'rajasthan', 'ram', 'restaurant', 
-    'saturday', 'september', 'shop', 'sleep', 'southafrica', 'story', 'sunday', 
-    'tamil nadu', 'temperature', 'temple', 'thank', 'thursday', 'toilet', 'tomato', 'town', 
-    'tuesday', 'usa', 'village', 'voice', 'wednesday', 'weight', 'welcome', 'hi', 'yourself'
-]
-
-# Available letter images (a-z)
-AVAILABLE_LETTERS = list('abcdefghijklmnopqrstuvwxyz')
+if SERVE_STATIC and GIFS_DIR.is_dir():
+    app.mount("/static/gifs", CachedStaticFiles(directory=GIFS_DIR), name="gifs")
+if SERVE_STATIC and LETTERS_DIR.is_dir():
+    app.mount("/static/letters", CachedStaticFiles(directory=LETTERS_DIR), name="letters")
+
+# Letter -> image URL, formatted once so spelling out text is a dict lookup per char
+_LETTER_URLS = {char: f"/static/letters/{char}.jpg" for char in AVAILABLE_LETTERS}
+
+# Translation table that deletes punctuation and digits (which have no sign
+# images) in a single str.translate pass
+_NORMALIZE_TABLE = str.maketrans('', '', string.punctuation + string.digits)
+
+def _build_phrase_trie(phrases) -> dict:
+    """
+    Build a word-level trie over the phrases.
+
+    Words are lowercased to match normalized input. Each node maps a word
+    to its child node; the "" key (never produced by str.split) holds the
+    lowercased phrase that ends at that node.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for word in phrase.split():
+            node = node.setdefault(word.lower(), {})
+        node[""] = phrase.lower()
+    return trie
+
+# Lowercased phrase (as normalized input will spell it) -> GIF URL with the
+# file's real casing, formatted once like the letter URLs
+_GIF_URLS = {phrase.lower(): f"/static/gifs/{phrase}.gif" for phrase in GIF_PHRASES}
+
+_PHRASE_TRIE = _build_phrase_trie(GIF_PHRASES)
+
+def _longest_phrase(words: list[str], start: int) -> tuple[str | None, int]:
+    """Return the longest known phrase starting at words[start] and the index after it"""
+    node = _PHRASE_TRIE
+    match, end = None, start
+    for i in range(start, len(words)):
+        node = node.get(words[i])
+        if node is None:
+            break
+        if "" in node:
+            match, end = node[""], i + 1
+    return match, end
 
 # ============ Request/Response Models ============
 
+# Length limits shared by every text accepted for conversion
+InputText = Annotated[str, Field(min_length=1, max_length=MAX_TEXT_LENGTH)]
+
 class TextInput(BaseModel):
-    text: str = Field(..., min_length=1, max_length=500, description="Text to convert to ISL")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    text: InputText = Field(..., description="Text to convert to ISL")
+
+class BatchInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # Item lengths are checked per text in convert_batch, so one bad text yields
+    # an error entry instead of a 422 for the whole batch
+    texts: list[str] = Field(..., min_length=1, max_length=MAX_BATCH_TEXTS, description="Texts to convert to ISL")
 
 class GifResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal["gif"] = "gif"
     src: str = Field(..., description="URL path to the GIF file")
     alt: str = Field(..., description="Alternative text for the GIF")
 
 class SequenceResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal["sequence"] = "sequence"
-    data: list[str] = Field(..., description="List of image URLs for each letter")
+    data: list[str] = Field(..., description="List of phrase GIF and letter image URLs in display order")
+    labels: list[str] = Field(..., description="Caption for each entry in data: the phrase or letter it shows")
     original_text: str = Field(..., description="The original processed text")
 
+# Tagged on "type" so pydantic picks the union member directly instead of trying each
+ConversionResult = Annotated[Union[GifResponse, SequenceResponse], Field(discriminator="type")]
+
+class ErrorResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    type: Literal["error"] = "error"
+    detail: str = Field(..., description="Why this text could not be converted")
+
+BatchResult = Annotated[Union[GifResponse, SequenceResponse, ErrorResult], Field(discriminator="type")]
+
+class BatchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    results: list[BatchResult] = Field(..., description="One result or error per input text, in order")
+
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     version: str
     phrases_count: int
     letters_count: int
 
 class PhrasesResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     phrases: list[str]
     count: int
 
+# Prebuilt GifResponse payloads for every known phrase (shared, treat as read-only)
+_PHRASE_CACHE = {
+    phrase.lower(): {"type": "gif", "src": _GIF_URLS[phrase.lower()], "alt": phrase}
+    for phrase in GIF_PHRASES
+}
+
+# Bodies of the GET endpoints never change at runtime, so encode them once at startup
+_ROOT_JSON = orjson.dumps({
+    "message": "Audio to ISL API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+})
+_HEALTH_JSON = orjson.dumps(HealthResponse(
+    status="healthy",
+    version="1.0.0",
+    phrases_count=len(GIF_PHRASES),
+    letters_count=len(AVAILABLE_LETTERS)
+).model_dump())
+_PHRASES_JSON = orjson.dumps(PhrasesResponse(
+    phrases=sorted(GIF_PHRASES),
+    count=len(GIF_PHRASES)
+).model_dump())
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+_HEALTH_ETAG = _etag(_HEALTH_JSON)
+_PHRASES_ETAG = _etag(_PHRASES_JSON)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 13.1.2): W/ prefixes are ignored"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def _cached_json(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Return a pre-encoded JSON body, or an empty 304 if the client already holds it"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # ============ API Endpoints ============
 
 @app.get("/", tags=["Health"])
-async def root():
+def root():
     """Root endpoint - API information"""
-    return {
-        "message": "Audio to ISL API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+def health_check(request: Request):
     """Health check endpoint for monitoring"""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        phrases_count=len(ISL_PHRASES),
-        letters_count=len(AVAILABLE_LETTERS)
-    )
+    # Clients must revalidate so every probe still reaches the server
+    return _cached_json(request, _HEALTH_JSON, _HEALTH_ETAG, "no-cache")
 
 @app.get("/api/phrases", response_model=PhrasesResponse, tags=["ISL Data"])
-async def get_available_phrases():
+def get_available_phrases(request: Request):
     """Get list of all available ISL phrases that have GIF mappings"""
-    return PhrasesResponse(
-        phrases=sorted(ISL_PHRASES),
-        count=len(ISL_PHRASES)
-    )
+    return _cached_json(request, _PHRASES_JSON, _PHRASES_ETAG, "public, max-age=86400")
 
-@app.post("/process", response_model=Union[GifResponse, SequenceResponse], tags=["ISL Conversion"])
-async def process_text(input_data: TextInput):
+@functools.lru_cache(maxsize=2048)
+def _process_one(raw: str) -> dict:
     """
-    Convert text to ISL visual representation.
-    
-    - If text matches a known phrase/word, returns a GIF path
-    - Otherwise, returns a sequence of letter images to spell it out
+    Convert a single text to its GifResponse/SequenceResponse payload.
+
+    Results are memoized per raw text, so the returned dict is shared
+    between requests and must not be mutated. Rejected texts raise and
+    are not cached.
     """
-    # Normalize text: lowercase and remove punctuation
-    text = input_data.text.lower().strip()
-    text = ''.join([c for c in text if c not in string.punctuation])
+    # Normalize text: lowercase, drop non-ASCII characters (typographic quotes
+    # from mobile keyboards, symbols like ™) and ASCII punctuation and digits,
+    # then collapse whitespace so the phrase lookup sees the same words as the
+    # trie walk
+    words = raw.lower().encode("ascii", "ignore").decode().translate(_NORMALIZE_TABLE).split()
+    text = " ".join(words)
     
     if not text:
         raise HTTPException(status_code=400, detail="Text cannot be empty after processing")
     
     # Check if it's a known phrase with a GIF
-    if text in ISL_PHRASES:
-        return GifResponse(
-            type="gif",
-            src=f"/static/gifs/{text}.gif",
-            alt=text
-        )
+    cached = _PHRASE_CACHE.get(text)
+    if cached is not None:
+        return cached
     
-    # Spell it out using letter images
+    # Greedily use the longest known phrase at each word, spelling out the rest
+    # with letter images and skipping unknown characters
     images = []
-    for char in text:
-        if char in AVAILABLE_LETTERS:
-            images.append(f"/static/letters/{char}.jpg")
-        # Skip spaces and unknown characters
+    labels = []
+    i = 0
+    while i < len(words):
+        phrase, end = _longest_phrase(words, i)
+        if phrase is not None:
+            images.append(_GIF_URLS[phrase])
+            labels.append(phrase)
+            i = end
+        else:
+            letters = [char for char in words[i] if char in _LETTER_URLS]
+            images.extend(map(_LETTER_URLS.__getitem__, letters))
+            labels.extend(letters)
+            i += 1
     
     if not images:
         raise HTTPException(
@@ -171,24 +350,70 @@ async def process_text(input_data: TextInput):
             detail="No valid characters found to convert"
         )
     
-    return SequenceResponse(
-        type="sequence",
-        data=images,
-        original_text=text
-    )
+    return {
+        "type": "sequence",
+        "data": images,
+        "labels": labels,
+        "original_text": text
+    }
 
-@app.post("/api/convert", response_model=Union[GifResponse, SequenceResponse], tags=["ISL Conversion"])
-async def convert_text(input_data: TextInput):
+@app.post("/process", response_model=ConversionResult, tags=["ISL Conversion"])
+def process_text(input_data: TextInput):
+    """
+    Convert text to ISL visual representation.
+    
+    - If text matches a known phrase/word, returns a GIF path
+    - Otherwise, returns a sequence that uses a GIF for each known phrase it
+      contains and letter images to spell out the remaining words
+    """
+    return _process_one(input_data.text)
+
+@app.post("/api/convert", response_model=ConversionResult, tags=["ISL Conversion"])
+def convert_text(input_data: TextInput):
     """
     Alias for /process endpoint.
     Convert text to ISL visual representation.
     """
-    return await process_text(input_data)
+    return process_text(input_data)
+
+@app.post("/api/convert_batch", response_model=BatchResponse, tags=["ISL Conversion"])
+def convert_batch(input_data: BatchInput):
+    """
+    Convert up to MAX_BATCH_TEXTS texts in one request.
+
+    Each text is converted exactly as by /process. A text that /process
+    would reject (empty, too long, or nothing left after normalization)
+    gets an error entry at its position instead, so one bad text does not
+    fail the rest of the batch.
+    """
+    results = []
+    for text in input_data.texts:
+        if not 1 <= len(text) <= MAX_TEXT_LENGTH:
+            results.append({
+                "type": "error",
+                "detail": f"Text must be between 1 and {MAX_TEXT_LENGTH} characters"
+            })
+            continue
+        try:
+            results.append(_process_one(text))
+        except HTTPException as exc:
+            results.append({"type": "error", "detail": exc.detail})
+    return {"results": results}
 
 # ============ Run Server ============
 
 if __name__ == "__main__":
     import uvicorn
-    print(f"Starting Audio to ISL API server on {HOST}:{PORT}")
+    print(f"Starting Audio to ISL API server on {HOST}:{PORT} with {WORKERS} worker(s)")
     print(f"API Documentation available at http://{HOST}:{PORT}/docs")
-    uvicorn.run(app, host=HOST, port=PORT)
+    # Multiple workers require the app as an import string rather than an object.
+    # uvloop and httptools replace the pure-Python event loop and HTTP parser;
+    # uvloop does not support Windows, which keeps the default asyncio loop.
+    uvicorn.run(
+        "server:app",
+        host=HOST,
+        port=PORT,
+        workers=WORKERS,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
@@ -0,0 +1,5 @@
+# Make the backend modules (server, isl_phrases) importable from the tests
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
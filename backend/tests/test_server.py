@@ -0,0 +1,45 @@
+# Tests for the Audio to ISL API server
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+client = TestClient(server.app)
+
+
+@pytest.mark.parametrize("text, src", [
+    ("do you watch TV", "/static/gifs/do you watch TV.gif"),
+    ("shall I help you", "/static/gifs/shall I help you.gif"),
+])
+def test_mixed_case_phrases_return_gif(text, src):
+    response = client.post("/process", json={"text": text})
+    assert response.status_code == 200
+    assert response.json()["type"] == "gif"
+    assert response.json()["src"] == src
+    assert client.get(src).status_code == 200
+
+
+def test_every_listed_phrase_returns_its_gif():
+    for phrase in client.get("/api/phrases").json()["phrases"]:
+        body = client.post("/process", json={"text": phrase}).json()
+        assert body["type"] == "gif", phrase
+        assert client.get(body["src"]).status_code == 200, phrase
+
+
+def test_batch_reports_bad_texts_per_position():
+    texts = ["hello", "", "a" * (server.MAX_TEXT_LENGTH + 1), "!!!", "hi there"]
+    response = client.post("/api/convert_batch", json={"texts": texts})
+    assert response.status_code == 200
+    types = [result["type"] for result in response.json()["results"]]
+    assert types == ["gif", "error", "error", "error", "sequence"]
+
+
+@pytest.mark.parametrize("text, alt", [
+    ("don’t worry", "dont worry"),
+    ("hello™", "hello"),
+])
+def test_non_ascii_characters_are_dropped(text, alt):
+    body = client.post("/process", json={"text": text}).json()
+    assert body["type"] == "gif"
+    assert body["alt"] == alt
@@ -64,14 +64,15 @@ function App() {
     checkBackend()
   }, [])
 
-  // Slideshow effect for letter sequence
+  // Slideshow effect for letter sequence (phrase GIFs stay on screen longer)
   useEffect(() => {
     let interval
     if (result?.type === 'sequence' && result.data.length > 0) {
       if (currentImageIndex < result.data.length - 1) {
+        const delay = result.data[currentImageIndex].endsWith('.gif') ? 2000 : 200
         interval = setInterval(() => {
           setCurrentImageIndex((prev) => prev + 1)
-        }, 200)
+        }, delay)
       }
     }
     return () => clearInterval(interval)
@@ -216,14 +217,15 @@ function App() {
                       <div className="relative w-full max-w-sm aspect-square bg-white rounded-2xl shadow-lg border border-gray-100 p-2 transform rotate-1 transition-transform">
                         <img
                           src={buildStaticUrl(result.data[currentImageIndex])}
-                          alt="Sign Language Letter"
+                          alt={result.labels?.[currentImageIndex] ?? 'Sign Language Letter'}
                           className="w-full h-full object-cover rounded-xl"
                         />
                       </div>
 
                       <div className="mt-8 flex flex-col items-center gap-2">
                         <div className="text-4xl font-bold text-gray-800 bg-white/80 backdrop-blur px-8 py-3 rounded-2xl shadow-sm border border-white/50 min-w-[120px] text-center">
-                          {result.original_text[currentImageIndex]?.toUpperCase()}
+                          {/* Backends older than the labels field only send original_text */}
+                          {(result.labels?.[currentImageIndex] ?? result.original_text[currentImageIndex])?.toUpperCase()}
                         </div>
                         <div className="h-1 w-32 bg-gray-200 rounded-full overflow-hidden">
                           <div
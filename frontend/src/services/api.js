@@ -92,7 +92,7 @@ export function getApiBaseUrl() {
 /**
  * Convert text to ISL visual representation
  * @param {string} text - Text to convert
- * @returns {Promise<{type: 'gif' | 'sequence', src?: string, alt?: string, data?: string[], original_text?: string}>}
+ * @returns {Promise<{type: 'gif' | 'sequence', src?: string, alt?: string, data?: string[], labels?: string[], original_text?: string}>}
  */
 export async function convertTextToISL(text) {
   if (!text || !text.trim()) {